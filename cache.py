@@ -0,0 +1,98 @@
+"""
+Cache Helper Functions
+
+Two-tier cache for results that are expensive to recompute (translations, TTS files).
+Tier 1 is a small in-process LRU; Tier 2 is Redis, used only when REDIS_URL is set.
+Cache failures never raise: a broken cache just behaves like a miss.
+"""
+
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+LOCAL_CACHE_SIZE = 2048
+DEFAULT_TTL = 86400 * 14  # 14 days
+
+_local: "OrderedDict[str, dict]" = OrderedDict()
+redis_client = None
+
+redis_url = os.getenv("REDIS_URL")
+
+if redis_url:
+    try:
+        import redis.asyncio as _redis  # type: ignore
+        redis_client = _redis.from_url(redis_url)
+    except Exception:
+        redis_client = None
+
+
+def make_key(namespace: str, text: str, lang: str) -> str:
+    """Versioned cache key, e.g. translate:v1:<md5(text)>:<lang>"""
+    digest = hashlib.md5(text.encode("utf-8")).hexdigest()
+    return f"{namespace}:v1:{digest}:{lang}"
+
+
+def _remember(key: str, value: dict):
+    _local[key] = value
+    _local.move_to_end(key)
+    if len(_local) > LOCAL_CACHE_SIZE:
+        _local.popitem(last=False)
+
+
+async def cache_get(key: str) -> Optional[dict]:
+    """Look up a key in the local LRU first, then Redis"""
+    value = _local.get(key)
+    if value is not None:
+        _local.move_to_end(key)
+        return value
+
+    if redis_client is None:
+        return None
+    try:
+        raw = await redis_client.get(key)
+    except Exception:
+        return None
+    if raw is None:
+        return None
+
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(value, dict):
+        return None
+    _remember(key, value)
+    return value
+
+
+async def cache_set(key: str, value: dict, ttl: int = DEFAULT_TTL):
+    """Store a value in both tiers"""
+    _remember(key, value)
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, json.dumps(value), ex=ttl)
+    except Exception:
+        pass
+
+
+async def cache_forget(key: str):
+    """Drop a key from both tiers (e.g. when the cached file has gone away)"""
+    _local.pop(key, None)
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(key)
+    except Exception:
+        pass
+
+
+def cache_clear():
+    """Empty the local tier (Redis entries expire on their own TTL)"""
+    _local.clear()
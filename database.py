@@ -53,3 +53,17 @@ def get_documents(collection_name: str, filter_dict: dict = None, limit: int = N
         cursor = cursor.limit(limit)
     
     return list(cursor)
+
+def update_document(collection_name: str, filter_dict: dict, update_dict: dict, upsert: bool = False):
+    """Update fields on the first matching document (optionally creating it), refreshing its timestamp"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    data_dict = update_dict.copy()
+    data_dict['updated_at'] = datetime.now(timezone.utc)
+
+    update = {"$set": data_dict}
+    if upsert:
+        update["$setOnInsert"] = {"created_at": data_dict['updated_at']}
+    result = db[collection_name].update_one(filter_dict, update, upsert=upsert)
+    return result.modified_count
@@ -1,19 +1,71 @@
 import os
 import io
-import uuid
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
+import re
+import html
+import asyncio
+import hashlib
+import time
+import secrets
+import signal
+import orjson
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, constr, field_validator
+from typing import Optional, List, Literal
 
-from database import db, create_document
+from database import db, create_document, get_documents, update_document
+from cache import make_key, cache_get, cache_set, cache_forget, cache_clear
 
 # External services for translation
-import requests
+import httpx
+
+# TTS engine, imported once at startup so the first /tts call doesn't pay for it.
+# Kept optional: if it is missing only /tts fails, with a clear error.
+try:
+    from gtts import gTTS as _gTTS  # type: ignore
+    _gtts_err = None
+except Exception as _e:
+    _gTTS = None
+    _gtts_err = str(_e)
+
+# Per-attempt upper bound for a single translation provider call (seconds)
+PROVIDER_TIMEOUT = 12
+
+# Provider endpoints are fixed for the life of the process; resolve them once
+_LIBRE_ENDPOINT = f"{os.getenv('LIBRETRANSLATE_URL', 'https://libretranslate.com').rstrip('/')}/translate"
+# MyMemory free endpoint; limited but OK for MVP
+_MYMEMORY_ENDPOINT = "https://api.mymemory.translated.net/get"
+
+app = FastAPI(
+    title="Indian Regional Language Dubbing API (MVP)",
+    # orjson serializes the dict responses (unicode translations, emoji) much faster than stdlib json
+    default_response_class=ORJSONResponse,
+)
+
+# Audio routes: mp3 is already compressed, and gzip would buffer the /tts?stream=1 body
+_UNCOMPRESSED_PREFIXES = ("/outputs/", "/tts")
+
+
+class SelectiveGZipMiddleware:
+    """GZipMiddleware for everything except the audio routes, chosen by request path"""
+
+    def __init__(self, app, **gzip_options):
+        self.app = app
+        self.gzip = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(_UNCOMPRESSED_PREFIXES):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
 
-app = FastAPI(title="Indian Regional Language Dubbing API (MVP)")
+
+# Compress larger JSON bodies (Indic scripts are verbose in UTF-8). Added before CORS
+# so CORS is the outer middleware and answers preflights without touching gzip.
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=500, compresslevel=5)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,19 +75,79 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("startup")
+async def _open_http_client():
+    # Shared async client: pooled keep-alive (HTTP/2 where offered) connections
+    # to the translation providers without tying up a worker thread per call
+    app.state.http = httpx.AsyncClient(
+        timeout=PROVIDER_TIMEOUT,
+        headers={"User-Agent": "dubber/1.0", "Accept": "application/json"},
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+
+@app.on_event("startup")
+async def _install_cache_reset():
+    # `kill -HUP <pid>` drops this worker's in-process cache for manual invalidation
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, cache_clear)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    await app.state.http.aclose()
+
 # Ensure outputs directory exists for audio files
 OUTPUT_DIR = os.path.join(os.getcwd(), "outputs")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 app.mount("/outputs", StaticFiles(directory=OUTPUT_DIR), name="outputs")
 
+# Target language codes; must match the keys of SUPPORTED_LANGS below.
+# Validated by pydantic before handlers run (unsupported codes get a 422).
+LangCode = Literal["hi", "bn", "ta", "te", "ml", "mr", "gu", "kn", "pa", "or", "as"]
+
+# Non-blank, bounded input text; empty or oversized payloads get a 422 instead of
+# a wasted provider round-trip. Checked with a pattern rather than stripping so
+# the caller's text is passed on (and echoed) unchanged.
+RequestText = constr(min_length=1, max_length=5000, pattern=r"\S")
+# Batch items may be blank (e.g. empty subtitle lines); those are echoed back as-is
+BatchText = constr(max_length=5000)
+
 class TranslateRequest(BaseModel):
-    text: str
-    target_language: str  # e.g., 'hi', 'bn', 'ta', 'te', 'ml', 'mr', 'gu', 'kn', 'pa', 'or', 'as'
+    text: RequestText
+    target_language: LangCode
+    source_language: Optional[str] = None  # any provider code, e.g. 'en'; defaults to auto-detect
+
+# Upper bounds for /translate/batch: strings and total characters per request (so
+# the packed upstream call stays within provider limits), and per-item fallback
+# lookups in flight at once (each races two providers on the shared pool)
+MAX_BATCH_TEXTS = 100
+MAX_BATCH_CHARS = 5000
+BATCH_FALLBACK_CONCURRENCY = 8
+
+class TranslateBatchRequest(BaseModel):
+    texts: List[BatchText] = Field(..., max_length=MAX_BATCH_TEXTS)
+    target_language: LangCode
     source_language: Optional[str] = None
 
+    @field_validator("texts")
+    @classmethod
+    def _check_total_size(cls, texts: List[str]) -> List[str]:
+        if sum(len(t) for t in texts) > MAX_BATCH_CHARS:
+            raise ValueError(f"batch texts must total at most {MAX_BATCH_CHARS} characters")
+        return texts
+
 class TTSRequest(BaseModel):
-    text: str
-    language: str
+    text: RequestText
+    language: LangCode
     voice: Optional[str] = None
 
 SUPPORTED_LANGS = {
@@ -54,38 +166,91 @@ SUPPORTED_LANGS = {
 
 # gTTS supported subset for a reliable MVP (others may fail)
 # We'll attempt and gracefully handle unsupported languages at runtime too
-GTTS_POSSIBLE = {"hi", "bn", "ta", "te", "ml", "mr", "gu", "kn", "pa"}
+GTTS_POSSIBLE = frozenset({"hi", "bn", "ta", "te", "ml", "mr", "gu", "kn", "pa"})
+
+def _static_json(payload) -> tuple:
+    """Serialize an immutable payload once; returns (body, strong ETag)"""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, or 304 if the client already has this ETag"""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400, immutable"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+_ROOT_BODY, _ROOT_ETAG = _static_json({"message": "Indian Regional Language Dubber API is running"})
+_LANGS_BODY, _LANGS_ETAG = _static_json(SUPPORTED_LANGS)
+
 
 @app.get("/")
-def read_root():
-    return {"message": "Indian Regional Language Dubber API is running"}
+async def read_root(request: Request):
+    return _static_json_response(request, _ROOT_BODY, _ROOT_ETAG)
 
 @app.get("/supported-languages")
-def supported_languages():
-    return SUPPORTED_LANGS
+async def supported_languages(request: Request):
+    return _static_json_response(request, _LANGS_BODY, _LANGS_ETAG)
+
+
+# Circuit breaker for LibreTranslate: after LIBRE_MAX_FAILURES consecutive errors,
+# skip it for LIBRE_COOLDOWN seconds instead of waiting on a provider that is down
+LIBRE_MAX_FAILURES = 3
+LIBRE_COOLDOWN = 60
+_libre_fail_count = 0
+_libre_open_until = 0.0
+
+
+def _is_libre_outage(exc: Exception) -> bool:
+    """Timeouts, transport errors, 403/429 and 5xx trip the breaker; other 4xx are the caller's fault"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status in (403, 429) or status >= 500
+    return isinstance(exc, (asyncio.TimeoutError, httpx.TransportError))
+
+
+async def _translate_via_libre(text: str, target: str, source: Optional[str] = None, fmt: str = "text") -> Optional[str]:
+    global _libre_fail_count, _libre_open_until
 
+    if time.monotonic() < _libre_open_until:
+        return None
 
-def _translate_via_libre(text: str, target: str, source: Optional[str] = None) -> Optional[str]:
-    url = os.getenv("LIBRETRANSLATE_URL", "https://libretranslate.com")
-    endpoint = f"{url.rstrip('/')}/translate"
+    # Timeout is applied here (not by callers) so a hung host counts as a failure;
+    # cancellation from losing the provider race is not an Exception and isn't counted
+    try:
+        translated = await asyncio.wait_for(_request_libre(text, target, source, fmt), timeout=PROVIDER_TIMEOUT)
+    except Exception as e:
+        if not _is_libre_outage(e):
+            raise
+        _libre_fail_count += 1
+        if _libre_fail_count >= LIBRE_MAX_FAILURES:
+            _libre_open_until = time.monotonic() + LIBRE_COOLDOWN
+        raise
+
+    # Success closes the breaker again (also after a half-open trial call)
+    _libre_fail_count = 0
+    return translated
+
+
+async def _request_libre(text: str, target: str, source: Optional[str], fmt: str) -> Optional[str]:
     payload = {
         "q": text,
         "source": source or "auto",
         "target": target,
-        "format": "text",
+        "format": fmt,
     }
-    r = requests.post(endpoint, data=payload, timeout=12)
+    r = await app.state.http.post(_LIBRE_ENDPOINT, data=payload)
     r.raise_for_status()
     data = r.json()
     return data.get("translatedText")
 
 
-def _translate_via_mymemory(text: str, target: str, source: Optional[str] = None) -> Optional[str]:
-    # MyMemory free endpoint; limited but OK for MVP
-    src = source or "auto"
-    endpoint = "https://api.mymemory.translated.net/get"
-    params = {"q": text, "langpair": f"{src}|{target}"}
-    r = requests.get(endpoint, params=params, timeout=12)
+async def _translate_via_mymemory(text: str, target: str, source: Optional[str] = None) -> Optional[str]:
+    params = {"q": text, "langpair": f"{source or 'auto'}|{target}"}
+    r = await app.state.http.get(_MYMEMORY_ENDPOINT, params=params)
     r.raise_for_status()
     data = r.json()
     if data and data.get("responseData"):
@@ -93,94 +258,357 @@ def _translate_via_mymemory(text: str, target: str, source: Optional[str] = None
     return None
 
 
-@app.post("/translate")
-def translate_text(req: TranslateRequest):
+def _store_job(data: dict):
+    """Audit-trail insert meant to run as a background task; ignore errors for MVP stability"""
+    try:
+        create_document("job", data)
+    except Exception:
+        pass
+
+
+def _translate_key(text: str, target: str, source: Optional[str] = None) -> str:
+    """Cache / in-flight key for a translation; explicit sources get their own entries"""
+    return make_key("translate", text, f"{source or 'auto'}-{target}")
+
+
+# Provider lookups in progress by cache key; concurrent identical requests await the same task
+_inflight_translate = {}
+
+
+async def _translate(text: str, target: str, source: Optional[str] = None):
     """
-    MVP translation with resilient fallbacks:
-    1) LibreTranslate (public or custom URL if set)
-    2) MyMemory free API
-    3) Fallback: return original text (so demo never 504s)
+    Translate a single string via cache, then LibreTranslate and MyMemory in parallel
+    (the first non-empty answer wins). Returns (translation or None, provider errors).
     """
-    if req.target_language not in SUPPORTED_LANGS:
-        raise HTTPException(status_code=400, detail="Unsupported target language")
+    cache_key = _translate_key(text, target, source)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached["text"], []
+
+    task = _inflight_translate.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_translate_uncached(text, target, source, cache_key))
+        _inflight_translate[cache_key] = task
+        task.add_done_callback(lambda _: _inflight_translate.pop(cache_key, None))
+    # Shielded so one caller disconnecting doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
+
 
+async def _translate_uncached(text: str, target: str, source: Optional[str], cache_key: str):
     translated = None
     errors = []
 
+    # Race both providers and take the first non-empty answer
+    providers = {
+        # LibreTranslate applies PROVIDER_TIMEOUT itself so the breaker sees timeouts
+        asyncio.create_task(_translate_via_libre(text, target, source)): "LibreTranslate",
+        asyncio.create_task(asyncio.wait_for(
+            _translate_via_mymemory(text, target, source),
+            timeout=PROVIDER_TIMEOUT,
+        )): "MyMemory",
+    }
+    pending = set(providers)
     try:
-        translated = _translate_via_libre(req.text, req.target_language, req.source_language)
-    except Exception as e:
-        errors.append(f"LibreTranslate error: {str(e)}")
+        while pending and not translated:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    errors.append(f"{providers[task]} error: {str(e)}")
+                    continue
+                if result and not translated:
+                    translated = result
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if translated:
+        await cache_set(cache_key, {"text": translated})
+    return translated, errors
 
+
+_BATCH_SEGMENT = re.compile(r'<p data-i="(\d+)">(.*?)</p>', re.DOTALL)
+
+
+async def _translate_batch_via_libre(texts: List[str], target: str, source: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Translate several strings with one LibreTranslate call by wrapping each in an
+    indexed <p> and sending format=html. Returns None if any segment is lost.
+    """
+    q = "".join(f'<p data-i="{i}">{html.escape(t)}</p>' for i, t in enumerate(texts))
+    translated = await _translate_via_libre(q, target, source, fmt="html")
     if not translated:
-        try:
-            translated = _translate_via_mymemory(req.text, req.target_language, req.source_language)
-        except Exception as e:
-            errors.append(f"MyMemory error: {str(e)}")
+        return None
+
+    segments = {int(i): html.unescape(body) for i, body in _BATCH_SEGMENT.findall(translated)}
+    if len(segments) != len(texts) or not all(segments.get(i) for i in range(len(texts))):
+        return None
+    return [segments[i] for i in range(len(texts))]
+
+
+@app.post("/translate")
+async def translate_text(req: TranslateRequest, background_tasks: BackgroundTasks):
+    """
+    MVP translation with resilient fallbacks:
+    1) LibreTranslate (public or custom URL if set) and MyMemory free API,
+       queried in parallel; the first non-empty answer wins
+    2) Fallback: return original text (so demo never 504s)
+    """
+    if req.source_language == req.target_language:
+        return {"translated": req.text, "notes": []}
+
+    translated, errors = await _translate(req.text, req.target_language, req.source_language)
 
     if not translated:
         # Last-resort fallback to keep demo flowing
         translated = req.text
 
-    # Try to store a job if DB is configured; ignore errors for MVP stability
-    try:
-        if db is not None:
-            create_document("job", {
-                "source_type": "text",
-                "source_text": req.text,
-                "source_language": req.source_language,
-                "target_language": req.target_language,
-                "translation": translated,
-                "status": "translated",
-            })
-    except Exception:
-        pass
+    # Store a job after the response is sent if DB is configured
+    if db is not None:
+        background_tasks.add_task(_store_job, {
+            "source_type": "text",
+            "source_text": req.text,
+            "source_language": req.source_language,
+            "target_language": req.target_language,
+            "translation": translated,
+            "status": "translated",
+        })
 
     return {"translated": translated, "notes": errors[:2]}
 
 
-@app.post("/tts")
-def text_to_speech(req: TTSRequest, request: Request):
+@app.post("/translate/batch")
+async def translate_batch(req: TranslateBatchRequest):
     """
-    MVP TTS using gTTS locally (no external keys). Saves MP3 under /outputs and returns a URL.
-    Some languages may not be supported by gTTS; we handle failures gracefully.
+    Translate many short strings (UI labels, subtitle lines) in one request.
+    Uncached strings go to LibreTranslate as a single call; if that fails we fall
+    back to translating each string on its own, and finally to the original text.
     """
-    if req.language not in SUPPORTED_LANGS:
-        raise HTTPException(status_code=400, detail="Unsupported language for TTS")
+    if req.source_language == req.target_language:
+        return {"translated": req.texts, "notes": []}
 
-    # Lazy import to speed cold starts and avoid import cost for unused endpoint
-    try:
-        from gtts import gTTS  # type: ignore
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"TTS engine unavailable: {str(e)}")
+    results: List[Optional[str]] = [None] * len(req.texts)
+    errors = []
+
+    for i, text in enumerate(req.texts):
+        if not text.strip():
+            results[i] = text
+            continue
+        cached = await cache_get(_translate_key(text, req.target_language, req.source_language))
+        if cached is not None:
+            results[i] = cached["text"]
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        batch = None
+        try:
+            batch = await _translate_batch_via_libre([req.texts[i] for i in missing], req.target_language, req.source_language)
+        except Exception as e:
+            errors.append(f"LibreTranslate batch error: {str(e)}")
+
+        if batch is not None:
+            for i, translated in zip(missing, batch):
+                results[i] = translated
+                await cache_set(_translate_key(req.texts[i], req.target_language, req.source_language), {"text": translated})
+        else:
+            limit = asyncio.Semaphore(BATCH_FALLBACK_CONCURRENCY)
 
-    # Attempt synthesis
-    filename = f"tts_{uuid.uuid4().hex}.mp3"
+            async def _translate_item(i: int):
+                async with limit:
+                    return await _translate(req.texts[i], req.target_language, req.source_language)
+
+            singles = await asyncio.gather(*(_translate_item(i) for i in missing))
+            for i, (translated, item_errors) in zip(missing, singles):
+                results[i] = translated
+                errors.extend(item_errors)
+
+    translated = [r or text for r, text in zip(results, req.texts)]
+    return {"translated": translated, "notes": errors[:2]}
+
+
+# TTS jobs known to this process, keyed by job_id (most recent MAX_TTS_JOBS kept)
+MAX_TTS_JOBS = 1024
+_tts_jobs = {}
+# Pending syntheses by cache key -> job_id, so identical requests share one job
+_tts_inflight = {}
+
+
+def _record_tts_job(job_id: str, job: dict):
+    _tts_jobs[job_id] = job
+    while len(_tts_jobs) > MAX_TTS_JOBS:
+        _tts_jobs.pop(next(iter(_tts_jobs)))
+
+
+def _tts_job_response(job_id: str, job: dict) -> dict:
+    response = {"job_id": job_id, "status": job["status"], "status_url": f"/tts/{job_id}"}
+    if job.get("audio_filename"):
+        response["audio_url"] = f"/outputs/{job['audio_filename']}"
+    if job.get("error"):
+        response["error"] = job["error"]
+    return response
+
+
+async def _synthesize(job_id: str, text: str, language: str, cache_key: str):
+    """Background gTTS synthesis for a queued job; updates the job record when done"""
+    # Insert the pending job document alongside synthesis rather than ahead of it,
+    # so a slow or unreachable DB doesn't delay the audio
+    pending_write = None
+    if db is not None:
+        pending_write = asyncio.create_task(asyncio.to_thread(_store_job, {
+            "job_id": job_id,
+            "source_type": "text",
+            "source_text": text,
+            "target_language": language,
+            "status": "pending",
+        }))
+
+    filename = f"tts_{secrets.token_urlsafe(10)}.mp3"
     filepath = os.path.join(OUTPUT_DIR, filename)
 
     try:
-        tts = gTTS(text=req.text, lang=req.language)
-        tts.save(filepath)
+        tts = _gTTS(text=text, lang=language)
+        # gTTS does blocking network + disk I/O; keep it off the event loop
+        await asyncio.to_thread(tts.save, filepath)
+        update = {"status": "tts_generated", "audio_filename": filename}
+        await cache_set(cache_key, {"audio_filename": filename})
     except Exception as e:
-        # Provide clear feedback and do not crash the demo
-        raise HTTPException(status_code=502, detail=f"TTS failed for '{req.language}'. Try a different language (e.g., hi). Error: {str(e)}")
+        update = {
+            "status": "failed",
+            "error": f"TTS failed for '{language}'. Try a different language (e.g., hi). Error: {str(e)}",
+        }
+    finally:
+        _tts_inflight.pop(cache_key, None)
+
+    _tts_jobs.get(job_id, {}).update(update)
+
+    # Try to store job info if DB available; ignore failures. Upsert in case the
+    # pending insert failed.
+    if pending_write is not None:
+        await pending_write
+        try:
+            await asyncio.to_thread(update_document, "job", {"job_id": job_id}, update, True)
+        except Exception:
+            pass
 
-    audio_url = f"/outputs/{filename}"
 
-    # Try to store job info if DB available; ignore failures
+async def _stream_tts(chunks, first: bytes, filename: str, cache_key: str, job: Optional[dict] = None):
+    """
+    Relay gTTS mp3 fragments to the client as they arrive while writing them to
+    /outputs, so the same text can be served from the cache next time.
+    The first fragment is fetched by the caller so failures still surface as a 502.
+    The job document, if given, is only stored once the whole file is on disk.
+    """
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    partial = f"{filepath}.part"
+    complete = False
     try:
+        with open(partial, "wb") as f:
+            f.write(first)
+            yield first
+            while True:
+                # Each fragment is a blocking HTTP call to Google; keep it off the event loop
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                f.write(chunk)
+                yield chunk
+        complete = True
+    finally:
+        if complete:
+            os.replace(partial, filepath)
+            await cache_set(cache_key, {"audio_filename": filename})
+            if job is not None:
+                await asyncio.to_thread(_store_job, job)
+        elif os.path.exists(partial):
+            os.remove(partial)
+
+
+@app.post("/tts")
+async def text_to_speech(req: TTSRequest, request: Request, background_tasks: BackgroundTasks, stream: bool = False):
+    """
+    MVP TTS using gTTS locally (no external keys). Synthesis runs in the background:
+    returns 202 with a job_id and status_url to poll for the /outputs audio URL.
+    Cached results return 200 with the audio URL straight away (no job_id).
+    With ?stream=1 the mp3 is streamed back in the response body instead.
+    Some languages may not be supported by gTTS; we handle failures gracefully.
+    """
+    if _gTTS is None:
+        raise HTTPException(status_code=500, detail=f"TTS engine unavailable: {_gtts_err}")
+
+    # Reuse a previous synthesis of the same text if its file is still on disk
+    cache_key = make_key("tts", req.text, req.language)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        if os.path.exists(os.path.join(OUTPUT_DIR, cached["audio_filename"])):
+            if stream:
+                return FileResponse(os.path.join(OUTPUT_DIR, cached["audio_filename"]), media_type="audio/mpeg")
+            # Nothing to poll for, so no job is recorded (it would only evict pending ones)
+            return {"status": "tts_generated", "audio_url": f"/outputs/{cached['audio_filename']}"}
+        await cache_forget(cache_key)
+
+    if stream:
+        filename = f"tts_{secrets.token_urlsafe(10)}.mp3"
+        try:
+            chunks = _gTTS(text=req.text, lang=req.language).stream()
+            first = await asyncio.to_thread(next, chunks)
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"TTS failed for '{req.language}'. Try a different language (e.g., hi). Error: {str(e)}")
+
+        job = None
         if db is not None:
-            create_document("job", {
+            job = {
                 "source_type": "text",
                 "source_text": req.text,
                 "target_language": req.language,
                 "audio_filename": filename,
                 "status": "tts_generated",
-            })
-    except Exception:
-        pass
+            }
+        return StreamingResponse(
+            _stream_tts(chunks, first, filename, cache_key, job),
+            media_type="audio/mpeg",
+            headers={"Content-Disposition": f'inline; filename="{filename}"'},
+        )
+
+    # An identical synthesis is already queued; hand out the same job
+    job_id = _tts_inflight.get(cache_key)
+    if job_id is not None and job_id in _tts_jobs:
+        return ORJSONResponse(status_code=202, content=_tts_job_response(job_id, _tts_jobs[job_id]))
+
+    job_id = secrets.token_urlsafe(12)
+    job = {"status": "pending"}
+    _record_tts_job(job_id, job)
+    _tts_inflight[cache_key] = job_id
+
+    background_tasks.add_task(_synthesize, job_id, req.text, req.language, cache_key)
+    return ORJSONResponse(status_code=202, content=_tts_job_response(job_id, job))
+
+
+@app.get("/tts/{job_id}")
+async def tts_status(job_id: str):
+    """Poll a TTS job: status is pending, tts_generated (with audio_url) or failed"""
+    job = _tts_jobs.get(job_id)
+
+    # Jobs started by another worker are only visible through the DB
+    if job is None and db is not None:
+        try:
+            docs = await asyncio.to_thread(get_documents, "job", {"job_id": job_id}, 1)
+            if docs:
+                job = docs[0]
+        except Exception:
+            pass
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="TTS job not found")
+    return _tts_job_response(job_id, job)
+
 
-    return {"audio_url": audio_url}
+# /test is polled as a health check: read env flags once and only ask Mongo
+# for its collection list every COLLECTIONS_TTL seconds
+COLLECTIONS_TTL = 10
+_COLLECTIONS_CACHE = {"t": 0.0, "v": []}
+_DB_URL_SET = bool(os.getenv("DATABASE_URL"))
+_DB_NAME_SET = bool(os.getenv("DATABASE_NAME"))
 
 
 @app.get("/test")
@@ -200,8 +628,11 @@ def test_database():
             response["database_name"] = getattr(db, 'name', None) or "✅ Connected"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
+                now = time.monotonic()
+                if now - _COLLECTIONS_CACHE["t"] > COLLECTIONS_TTL:
+                    _COLLECTIONS_CACHE["v"] = db.list_collection_names()[:10]
+                    _COLLECTIONS_CACHE["t"] = now
+                response["collections"] = _COLLECTIONS_CACHE["v"]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
                 response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
@@ -210,12 +641,25 @@ def test_database():
     except Exception as e:
         response["database"] = f"❌ Error: {str(e)[:50]}"
 
-    response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-    response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+    response["database_url"] = "✅ Set" if _DB_URL_SET else "❌ Not Set"
+    response["database_name"] = "✅ Set" if _DB_NAME_SET else "❌ Not Set"
     return response
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # libuv event loop and C HTTP parser. Single worker by default: TTS jobs, the local
+    # cache tier and in-flight dedupe live in process memory, so a /tts/{job_id} poll
+    # landing on another worker can 404. Set WEB_CONCURRENCY (e.g. to the core count)
+    # only with a database configured for job status. Per-worker resources (the httpx
+    # client) are opened in the startup hook.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
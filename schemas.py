@@ -51,6 +51,7 @@ class Job(BaseModel):
     target_language: str = Field(..., description="Target language code (e.g., 'hi', 'ta')")
     translation: Optional[str] = Field(None, description="Translated text")
     audio_filename: Optional[str] = Field(None, description="Generated audio file name under outputs/")
+    job_id: Optional[str] = Field(None, description="Public id used to poll TTS jobs via GET /tts/{job_id}")
     status: str = Field("pending", description="Job status: pending, completed, failed")
     meta: Optional[Dict] = Field(default_factory=dict, description="Additional metadata")
 